@@ -567,6 +567,10 @@ class AsyncPGMQueueOperationsMixin:
             queue=queue,
             count=len(msg_ids),
         )
+
+        if not msg_ids:
+            return []
+
         rows = await self._execute_with_result(
             _sql.DELETE_BATCH, (queue, msg_ids), conn=conn
         )
@@ -591,6 +595,10 @@ class AsyncPGMQueueOperationsMixin:
             queue=queue,
             count=len(msg_ids),
         )
+
+        if not msg_ids:
+            return []
+
         rows = await self._execute_with_result(
             _sql.ARCHIVE_BATCH, (queue, msg_ids), conn=conn
         )
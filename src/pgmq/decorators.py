@@ -6,10 +6,12 @@ Provides automatic transaction management with connection injection.
 """
 
 import functools
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
+from psycopg import Pipeline
 
-def transaction(func: Callable) -> Callable:
+
+def transaction(func: Optional[Callable] = None, *, pipeline: bool = False) -> Callable:
     """
     Synchronous transaction decorator.
 
@@ -19,24 +21,42 @@ def transaction(func: Callable) -> Callable:
     3. Injecting connection as 'conn' keyword argument
     4. Handling commit/rollback automatically
 
+    With ``pipeline=True`` the transaction runs inside psycopg's
+    ``conn.pipeline()``, so BEGIN is sent with the first statement instead
+    of taking its own round-trip. Each fetch still waits on the server, so
+    the decorated function should only fetch results once it has queued its
+    statements. When libpq does not support pipeline mode (libpq < 14), the
+    plain transaction is used instead.
+
     Usage:
         @transaction
         def my_method(self, queue: str, conn=None):
             # conn is provided, either injected or passed explicitly
             conn.execute("SELECT ...")
+
+        @transaction(pipeline=True)
+        def my_batch_method(self, queue: str, conn=None):
+            ...
     """
+    if func is None:
+        return functools.partial(transaction, pipeline=pipeline)
+
+    pipeline = pipeline and Pipeline.is_supported()
 
     @functools.wraps(func)
     def wrapper(self, *args: Any, **kwargs: Any) -> Any:
         # Check if connection already provided
-        if "conn" in kwargs and kwargs["conn"] is not None:
+        if kwargs.get("conn") is not None:
             return func(self, *args, **kwargs)
 
         # Acquire connection and manage transaction
-        with self.pool.connection() as conn:
-            with conn.transaction():
+        if pipeline:
+            with self.pool.connection() as conn, conn.pipeline(), conn.transaction():
                 kwargs["conn"] = conn
                 return func(self, *args, **kwargs)
+        with self.pool.connection() as conn, conn.transaction():
+            kwargs["conn"] = conn
+            return func(self, *args, **kwargs)
 
     return wrapper
 
@@ -61,7 +81,7 @@ def sqlalchemy_transaction(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self, *args: Any, **kwargs: Any) -> Any:
         # Check if connection already provided
-        if "conn" in kwargs and kwargs["conn"] is not None:
+        if kwargs.get("conn") is not None:
             return func(self, *args, **kwargs)
 
         # engine.begin() starts a transaction, commits on success,
@@ -84,7 +104,7 @@ def sqlalchemy_async_transaction(func: Callable) -> Callable:
     @functools.wraps(func)
     async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
         # Check if connection already provided
-        if "conn" in kwargs and kwargs["conn"] is not None:
+        if kwargs.get("conn") is not None:
             return await func(self, *args, **kwargs)
 
         # engine.begin() starts a transaction, commits on success,
@@ -101,26 +121,19 @@ def async_transaction(func: Callable) -> Callable:
     Asynchronous transaction decorator.
 
     Same functionality as @transaction but for async methods using asyncpg.
-    Manages asyncpg transactions properly with explicit start/commit/rollback.
+    The transaction is managed by asyncpg's ``conn.transaction()`` context
+    manager, which also rolls back when the task is cancelled.
     """
 
     @functools.wraps(func)
     async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
         # Check if connection already provided
-        if "conn" in kwargs and kwargs["conn"] is not None:
+        if kwargs.get("conn") is not None:
             return await func(self, *args, **kwargs)
 
         # Acquire connection and manage transaction
-        async with self.pool.acquire() as conn:
-            txn = conn.transaction()
-            await txn.start()
-            try:
-                kwargs["conn"] = conn
-                result = await func(self, *args, **kwargs)
-                await txn.commit()
-                return result
-            except Exception:
-                await txn.rollback()
-                raise
+        async with self.pool.acquire() as conn, conn.transaction():
+            kwargs["conn"] = conn
+            return await func(self, *args, **kwargs)
 
     return wrapper
@@ -18,6 +18,15 @@ try:
 except ImportError:
     LOGURU_AVAILABLE = False
 
+# stdlib level numbers -> loguru level names
+_LOGURU_LEVEL_NAMES: Dict[int, str] = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
 
 class LoggingManager:
     """
@@ -212,14 +221,7 @@ class LoggingManager:
         effective_level = "DEBUG" if verbose else "WARNING"
         if log_level is not None:
             if isinstance(log_level, int):
-                level_map = {
-                    logging.DEBUG: "DEBUG",
-                    logging.INFO: "INFO",
-                    logging.WARNING: "WARNING",
-                    logging.ERROR: "ERROR",
-                    logging.CRITICAL: "CRITICAL",
-                }
-                effective_level = level_map.get(log_level, "INFO")
+                effective_level = _LOGURU_LEVEL_NAMES.get(log_level, "INFO")
             else:
                 effective_level = str(log_level)
 
@@ -287,14 +289,7 @@ class LoggingManager:
             cls._remove_pgmq_handlers()
 
             if isinstance(log_level, int):
-                level_map = {
-                    logging.DEBUG: "DEBUG",
-                    logging.INFO: "INFO",
-                    logging.WARNING: "WARNING",
-                    logging.ERROR: "ERROR",
-                    logging.CRITICAL: "CRITICAL",
-                }
-                log_level = level_map.get(log_level, "INFO")
+                log_level = _LOGURU_LEVEL_NAMES.get(log_level, "INFO")
 
             if log_format is None:
                 if structured:
@@ -339,13 +334,18 @@ class LoggingManager:
 
         if is_stdlib:
             # Standard Library Path
+            if isinstance(level, str):
+                level = getattr(logging, level.upper(), logging.INFO)
+
+            # Skip formatting the context for disabled levels (e.g. the DEBUG
+            # entry emitted by every queue operation).
+            if not logger.isEnabledFor(level):
+                return
+
             if context:
                 context_str = " | ".join([f"{k}={v}" for k, v in context.items()])
                 message = f"{message} | {context_str}"
 
-            if isinstance(level, str):
-                level = getattr(logging, level.upper(), logging.INFO)
-
             logger.log(level, message)
         else:
             # Loguru Path (or compatible logger)
@@ -361,14 +361,7 @@ class LoggingManager:
                 logger = logger.bind(**context)
 
             if isinstance(level, int):
-                level_map = {
-                    logging.DEBUG: "DEBUG",
-                    logging.INFO: "INFO",
-                    logging.WARNING: "WARNING",
-                    logging.ERROR: "ERROR",
-                    logging.CRITICAL: "CRITICAL",
-                }
-                level = level_map.get(level, "INFO")
+                level = _LOGURU_LEVEL_NAMES.get(level, "INFO")
 
             logger.log(level, message)
 
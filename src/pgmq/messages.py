@@ -46,7 +46,7 @@ def _get_value(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Complete message record matching pgmq.message_record type.
@@ -93,7 +93,7 @@ class Message:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueRecord:
     """
     Queue metadata matching pgmq.queue_record type.
@@ -117,7 +117,7 @@ class QueueRecord:
         return self.queue_name
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueMetrics:
     """
     Queue statistics matching pgmq.metrics_result type.
@@ -158,7 +158,7 @@ class QueueMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicBinding:
     """
     Topic routing binding record.
@@ -179,7 +179,7 @@ class TopicBinding:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingResult:
     """
     Result from test_routing function.
@@ -198,7 +198,7 @@ class RoutingResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTopicResult:
     """
     Result from send_batch_topic function.
@@ -215,7 +215,7 @@ class BatchTopicResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationThrottle:
     """
     Notification throttle configuration.
@@ -24,6 +24,7 @@ class PsycopgSyncBackend:
     """psycopg connection pool and SQL execution for the sync client."""
 
     _transaction_decorator = transaction
+    _pipeline_transaction_decorator = transaction(pipeline=True)
 
     def _encode_jsonb(self, value: Dict[str, Any]) -> Jsonb:
         return Jsonb(value)
@@ -57,6 +57,16 @@ TRANSACTIONAL_SYNC_METHODS = frozenset(
     }
 )
 
+# Batch methods whose transaction is pipelined when the backend supports it.
+PIPELINED_SYNC_METHODS = frozenset(
+    {
+        "send_batch",
+        "send_batch_topic",
+        "delete_batch",
+        "archive_batch",
+    }
+)
+
 
 class SyncPGMQueueOperationsMixin:
     """
@@ -67,22 +77,39 @@ class SyncPGMQueueOperationsMixin:
     - ``_encode_jsonb``, ``_encode_jsonb_list``
     - ``_json_parser`` property returning a JSON parser callable
     - ``_transaction_decorator`` class attribute (transaction decorator)
+
+    Subclasses may set ``_pipeline_transaction_decorator`` to a decorator used
+    for ``PIPELINED_SYNC_METHODS`` instead of ``_transaction_decorator``. It is
+    only used when set on the same class as ``_transaction_decorator``.
     """
 
     _transaction_decorator = None
+    _pipeline_transaction_decorator = None
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         decorator = getattr(cls, "_transaction_decorator", None)
         if decorator is None:
             return
+        # Only pair the pipeline decorator with the _transaction_decorator it
+        # was declared next to, so overriding _transaction_decorator in a
+        # subclass also covers the batch methods.
+        owner = next(
+            klass for klass in cls.__mro__ if "_transaction_decorator" in klass.__dict__
+        )
+        pipeline_decorator = (
+            owner.__dict__.get("_pipeline_transaction_decorator") or decorator
+        )
         for name in TRANSACTIONAL_SYNC_METHODS:
             if (
                 name in SyncPGMQueueOperationsMixin.__dict__
                 and name not in cls.__dict__
             ):
                 method = SyncPGMQueueOperationsMixin.__dict__[name]
-                setattr(cls, name, decorator(method))
+                if name in PIPELINED_SYNC_METHODS:
+                    setattr(cls, name, pipeline_decorator(method))
+                else:
+                    setattr(cls, name, decorator(method))
 
     def _encode_jsonb(self, value: Dict[str, Any]) -> Any:
         raise NotImplementedError
@@ -560,6 +587,10 @@ class SyncPGMQueueOperationsMixin:
             queue=queue,
             count=len(msg_ids),
         )
+
+        if not msg_ids:
+            return []
+
         rows = self._execute_with_result(_sql.DELETE_BATCH, (queue, msg_ids), conn=conn)
         return [row[0] for row in rows]
 
@@ -580,6 +611,10 @@ class SyncPGMQueueOperationsMixin:
             queue=queue,
             count=len(msg_ids),
         )
+
+        if not msg_ids:
+            return []
+
         rows = self._execute_with_result(
             _sql.ARCHIVE_BATCH, (queue, msg_ids), conn=conn
         )
@@ -76,6 +76,10 @@ class TestAsyncQueue(unittest.IsolatedAsyncioTestCase):
         msgs = await self.queue.read_batch(self.test_queue, batch_size=2)
         self.assertEqual(len(msgs), 2)
 
+    async def test_delete_and_archive_batch_empty(self):
+        self.assertEqual(await self.queue.delete_batch(self.test_queue, []), [])
+        self.assertEqual(await self.queue.archive_batch(self.test_queue, []), [])
+
     async def test_pop(self):
         msg_id = await self.queue.send(self.test_queue, self.test_message)
         msg = await self.queue.pop(self.test_queue)
@@ -4,8 +4,10 @@ import time
 import os
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch, MagicMock
-from pgmq import Message, PGMQueue
-from pgmq.decorators import transaction
+import psycopg
+from pgmq import Message, PGMQueue, SQLAlchemyPGMQueue
+from pgmq.decorators import transaction, sqlalchemy_transaction
+from pgmq.sync_operations import PIPELINED_SYNC_METHODS
 from tests.utils import (
     PGMQTestCase,
     PG_HOST,
@@ -158,6 +160,10 @@ class TestSyncQueue(PGMQTestCase):
         self.queue.delete_batch(self.test_queue, msg_ids)
         self.assertEqual(len(self.queue.read_batch(self.test_queue, batch_size=10)), 0)
 
+    def test_delete_and_archive_batch_empty(self):
+        self.assertEqual(self.queue.delete_batch(self.test_queue, []), [])
+        self.assertEqual(self.queue.archive_batch(self.test_queue, []), [])
+
     def test_set_vt(self):
         msg_id = self.queue.send(self.test_queue, self.test_message)
         future = datetime.now(timezone.utc) + timedelta(seconds=60)
@@ -211,6 +217,41 @@ class TestSyncQueue(PGMQTestCase):
         txn_success(self.queue)
         self.assertIsNotNone(self.queue.read(self.test_queue))
 
+    def test_transaction_pipeline_commit(self):
+        @transaction(pipeline=True)
+        def txn_success(queue, conn=None):
+            queue.send(self.test_queue, {"i": 1}, conn=conn)
+            queue.send(self.test_queue, {"i": 2}, conn=conn)
+
+        txn_success(self.queue)
+        self.assertEqual(len(self.queue.read_batch(self.test_queue, batch_size=5)), 2)
+
+    def test_transaction_pipeline_rollback(self):
+        @transaction(pipeline=True)
+        def txn_fail(queue, conn=None):
+            queue.send(self.test_queue, self.test_message, conn=conn)
+            raise Exception("Fail")
+
+        with self.assertRaises(Exception):
+            txn_fail(self.queue)
+        self.assertIsNone(self.queue.read(self.test_queue))
+
+    def test_pipelined_batch_server_error(self):
+        """A server error inside a pipelined batch surfaces like a plain one."""
+        missing = self.get_queue_name("missing")
+        with self.queue.pool.connection() as conn:
+            with self.assertRaises(psycopg.Error) as plain:
+                with conn.transaction():
+                    self.queue.delete_batch(missing, [1], conn=conn)
+
+        with self.assertRaises(psycopg.Error) as piped:
+            self.queue.delete_batch(missing, [1])
+        self.assertIs(type(piped.exception), type(plain.exception))
+
+        # Pooled connections are still usable afterwards
+        msg_ids = self.queue.send_batch(self.test_queue, [{"i": 1}, {"i": 2}])
+        self.assertEqual(self.queue.delete_batch(self.test_queue, msg_ids), msg_ids)
+
     def test_transaction_create_queue(self):
         """Test creating a queue within a transaction."""
 
@@ -302,6 +343,64 @@ class TestSyncQueue(PGMQTestCase):
             pass  # Accept failure if deprecated
 
 
+class TestPipelinedMethods(unittest.TestCase):
+    """Which methods run inside conn.pipeline() (no database required)."""
+
+    def make_queue(self):
+        pool = MagicMock()
+        conn = pool.connection.return_value.__enter__.return_value
+        # One row shape that every batch method can parse
+        conn.execute.return_value.fetchall.return_value = [("q", 1)]
+        queue = PGMQueue(pool=pool, init_extension=False, verbose=False)
+        return queue, conn
+
+    @unittest.skipUnless(
+        psycopg.Pipeline.is_supported(), "libpq without pipeline support"
+    )
+    def test_psycopg_batch_methods_are_pipelined(self):
+        queue, conn = self.make_queue()
+        queue.send_batch("q", [{"i": 1}])
+        queue.send_batch_topic("a.b", [{"i": 1}])
+        queue.delete_batch("q", [1])
+        queue.archive_batch("q", [1])
+        self.assertEqual(conn.pipeline.call_count, len(PIPELINED_SYNC_METHODS))
+
+    def test_psycopg_other_methods_are_not_pipelined(self):
+        queue, conn = self.make_queue()
+        queue.send("q", {"i": 1})
+        queue.delete("q", 1)
+        conn.pipeline.assert_not_called()
+        self.assertEqual(conn.transaction.call_count, 2)
+
+    def test_pipeline_falls_back_without_libpq_support(self):
+        queue, conn = self.make_queue()
+        with patch.object(psycopg.Pipeline, "is_supported", return_value=False):
+            decorated = transaction(lambda queue, conn=None: conn, pipeline=True)
+        self.assertIs(decorated(queue), conn)
+        conn.pipeline.assert_not_called()
+        conn.transaction.assert_called_once()
+
+    def test_subclass_transaction_decorator_covers_batch_methods(self):
+        def traced(func):
+            wrapper = transaction(func)
+            wrapper.traced = True
+            return wrapper
+
+        class TracedQueue(PGMQueue):
+            _transaction_decorator = staticmethod(traced)
+
+        for name in ("send", *PIPELINED_SYNC_METHODS):
+            self.assertTrue(getattr(getattr(TracedQueue, name), "traced", False), name)
+
+    @unittest.skipIf(SQLAlchemyPGMQueue is None, "sqlalchemy not installed")
+    def test_sqlalchemy_falls_back_to_transaction_decorator(self):
+        plain_wrapper = sqlalchemy_transaction(lambda self, conn=None: None)
+        self.assertIsNone(SQLAlchemyPGMQueue._pipeline_transaction_decorator)
+        for name in PIPELINED_SYNC_METHODS:
+            method = getattr(SQLAlchemyPGMQueue, name)
+            self.assertIs(method.__code__, plain_wrapper.__code__, name)
+
+
 class TestInitNoExtension(unittest.TestCase):
     def test_no_extension_sync(self):
         """Ensure extension is not created when flag is False."""
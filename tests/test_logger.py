@@ -133,6 +133,22 @@ class TestWithStdlib(unittest.TestCase):
         # Cleanup only the test handler, leave the file handler for verification if needed
         logger.removeHandler(handler)
 
+    def test_log_with_context_stdlib_disabled_level(self):
+        logger = logging.getLogger("test_context_disabled")
+        logger.setLevel(logging.WARNING)
+        buffer = io.StringIO()
+        handler = logging.StreamHandler(buffer)
+        logger.addHandler(handler)
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError("context formatted for a disabled level")
+
+        log_with_context(logger, logging.DEBUG, "Skipped", value=Unformattable())
+        self.assertEqual(buffer.getvalue(), "")
+
+        logger.removeHandler(handler)
+
     def test_performance_decorator_sync(self):
         log = logging.getLogger("test_perf")
         logger = LoggingManager.get_logger("test_perf", verbose=True)
@@ -341,6 +341,11 @@ class TestAsyncSQLAlchemyQueue(unittest.IsolatedAsyncioTestCase):
         archived = await self.queue.archive_batch("test_queue", msg_ids)
         self.assertEqual(len(archived), 3)
 
+    async def test_delete_and_archive_batch_empty(self):
+        """Empty id lists return without querying."""
+        self.assertEqual(await self.queue.delete_batch("test_queue", []), [])
+        self.assertEqual(await self.queue.archive_batch("test_queue", []), [])
+
     async def test_purge(self):
         """Test purging a queue."""
         await self.queue.send_batch("test_queue", [{"i": i} for i in range(10)])